@@ -27,14 +27,23 @@ def api_view(
 ):  # type:(...) -> Callable
 
     if not (
-        inspect.isclass(permission_class)
+        isinstance(permission_class, type)
         and issubclass(permission_class, BasePermission)
     ):
         # In case the decorator's called without parenthesis (`@api_view`),
         # the `permission_class` variable holds the real view.
         return api_view()(permission_class)
 
-    deserializers_http_methods_map = build_deserializer_map(deserializer_class)
+    # Built once at decoration time: membership checks inside the wrapper
+    # become O(1) hash lookups instead of linear tuple scans.
+    allowed_methods = frozenset(allowed_methods)
+    # The default AllPassDeserializer passes payloads through untouched:
+    # no need to build (nor consult) a method -> deserializer map at all.
+    deserializers_http_methods_map = (
+        None
+        if deserializer_class is AllPassDeserializer
+        else build_deserializer_map(deserializer_class)
+    )
 
     def view_decorator(view):
         # type:(Union[Callable, ClassVar]) -> Union[Callable, ClassVar]
@@ -46,7 +55,7 @@ def api_view(
                 allow_forms,
                 view,
             )
-        elif inspect.isclass(view) and issubclass(view, View):
+        elif isinstance(view, type) and issubclass(view, View):
             return build_class_wrapper(
                 permission_class,
                 allowed_methods,
@@ -56,7 +65,7 @@ def api_view(
             )
         given_str = (
             "{} class".format(view.__name__)
-            if inspect.isclass(view)
+            if isinstance(view, type)
             else "{} object".format(view.__class__.__name__)
         )
         raise TypeError(
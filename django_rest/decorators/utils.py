@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 
-import json
 from functools import wraps
 
-from django.http import JsonResponse
+try:
+    import orjson as json  # Parses bytes directly, ~2x faster than stdlib.
+except ImportError:
+    import json
+
+from django.http import HttpResponse
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 
@@ -16,12 +20,21 @@ from django_rest.http.exceptions import (
     PermissionDenied,
     UnsupportedMediaType,
 )
-from django_rest.http.methods import SUPPORTING_PAYLOAD_METHODS
-from django_rest.permissions import BasePermission
+from django_rest.http.methods import ALL_METHODS, SUPPORTING_PAYLOAD_METHODS
+from django_rest.permissions import AllowAny, BasePermission
+
+#: Maps each HTTP method to its lowercased handler name, so dispatching
+#: doesn't allocate a new string through `.lower()` on every request.
+LOWERCASE_METHODS_MAP = {method: method.lower() for method in ALL_METHODS}
+
+#: Frozen once, shared by every wrapper allowing all known methods.
+_ALL_METHODS_SET = frozenset(ALL_METHODS)
 
-FORMS_CONTENT_TYPES = (
-    "application/x-www-form-urlencoded",
-    "multipart/form-data",
+FORMS_CONTENT_TYPES = frozenset(
+    (
+        "application/x-www-form-urlencoded",
+        "multipart/form-data",
+    )
 )
 
 
@@ -53,9 +66,11 @@ def build_deserializer_map(deserializer_class):
 
 
 def transform_query_dict_into_regular_dict(query_dict):
+    if not query_dict:
+        return {}
     return {
         key: list_val if len(list_val) > 1 else list_val[0]
-        for key, list_val in dict(query_dict).items()
+        for key, list_val in query_dict.lists()
     }
 
 
@@ -72,15 +87,170 @@ def extract_request_payload(request, allow_form_data=False):
     - Returns `None`
     """
     method = request.method
-    if not allow_form_data and request.content_type in FORMS_CONTENT_TYPES:
-        raise UnsupportedMediaType
-    elif request.content_type in FORMS_CONTENT_TYPES and request.method == "POST":
-        return transform_query_dict_into_regular_dict(request.POST)
-
+    # GET-like methods carry no payload: bail out before even looking at the
+    # content type, since they're the majority of the traffic on most APIs.
     if method not in SUPPORTING_PAYLOAD_METHODS:
         return None
 
-    return json.loads(request.body.decode())
+    # One content_type access and one frozenset lookup, instead of two each.
+    is_form = request.content_type in FORMS_CONTENT_TYPES
+    if is_form:
+        if not allow_form_data:
+            raise UnsupportedMediaType
+        if method == "POST":
+            return transform_query_dict_into_regular_dict(request.POST)
+
+    # Memoize the parsed body on the request itself, so that middlewares or
+    # views accessing the payload later don't pay the JSON parsing cost twice.
+    try:
+        return request._cached_json_body
+    except AttributeError:
+        request._cached_json_body = json.loads(request.body)
+    return request._cached_json_body
+
+
+def _normalize_allowed_methods(allowed_methods):
+    # type:(Iterable[str]) -> Iterable[str]
+    """Widens an "all known methods" set to the shared frozen one.
+
+    The method check itself is never compiled out of the wrappers: verbs
+    outside `ALL_METHODS` (PROPFIND, ..) must still get a 405 even when every
+    known method is allowed. That case only swaps the membership-test target
+    for the shared frozen set, keeping the O(1) lookup.
+    """
+    try:
+        if _ALL_METHODS_SET <= frozenset(allowed_methods):
+            return _ALL_METHODS_SET
+    except TypeError:
+        # Non-iterable `allowed_methods`: left as given, tested per request.
+        pass
+    return allowed_methods
+
+
+def _classify_deserializers(deserializers_http_methods_map):
+    # type:(Optional[Dict[str, ClassVar[Deserializer]]]) -> Tuple[bool, Optional[ClassVar[Deserializer]]]
+    """Returns the `(skips_deserialization, single_deserializer)` pair
+    deciding which pipeline variant a wrapper gets.
+    """
+    if deserializers_http_methods_map is None:
+        # `api_view` passes None for the default AllPassDeserializer case.
+        return True, None
+    try:
+        deserializer_classes = frozenset(deserializers_http_methods_map.values())
+    except TypeError:
+        return False, None
+    skips_deserialization = all(
+        deserializer is AllPassDeserializer for deserializer in deserializer_classes
+    )
+    # A single deserializer class for all payload methods (the common case
+    # when `deserializer_class` is given as a class, not a dict) makes the
+    # per-request dict lookup pointless.
+    single_deserializer = (
+        tuple(deserializer_classes)[0] if len(deserializer_classes) == 1 else None
+    )
+    return skips_deserialization, single_deserializer
+
+
+def _build_skipping_pipeline(view_function, allow_forms):
+    # type:(Callable, bool) -> Callable
+    def pipeline(request, kwargs):
+        # type:(HttpRequest, Dict[str, Any]) -> JsonResponse
+        return view_function(
+            request,
+            url_params=kwargs,
+            query_params=transform_query_dict_into_regular_dict(request.GET),
+            deserialized_data=extract_request_payload(request, allow_forms),
+        )
+
+    return pipeline
+
+
+def _build_single_deserializer_pipeline(view_function, allow_forms, deserializer_class):
+    # type:(Callable, bool, ClassVar[Deserializer]) -> Callable
+    def pipeline(request, kwargs):
+        # type:(HttpRequest, Dict[str, Any]) -> JsonResponse
+        query_params = transform_query_dict_into_regular_dict(request.GET)
+        payload = extract_request_payload(request, allow_forms)
+        if request.method in SUPPORTING_PAYLOAD_METHODS:
+            deserializer = deserializer_class(data=payload)
+            if not deserializer.is_valid():
+                raise BadRequest
+            deserialized_data = deserializer.data
+        else:
+            deserialized_data = None
+
+        return view_function(
+            request,
+            url_params=kwargs,
+            query_params=query_params,
+            deserialized_data=deserialized_data,
+        )
+
+    return pipeline
+
+
+def _build_deserializer_map_pipeline(
+    view_function, allow_forms, deserializers_http_methods_map
+):
+    # type:(Callable, bool, Dict[str, ClassVar[Deserializer]]) -> Callable
+    def pipeline(request, kwargs):
+        # type:(HttpRequest, Dict[str, Any]) -> JsonResponse
+        query_params = transform_query_dict_into_regular_dict(request.GET)
+        payload = extract_request_payload(request, allow_forms)
+        if request.method in SUPPORTING_PAYLOAD_METHODS:
+            deserializer = deserializers_http_methods_map[request.method](data=payload)
+            if not deserializer.is_valid():
+                raise BadRequest
+            deserialized_data = deserializer.data
+        else:
+            deserialized_data = None
+
+        return view_function(
+            request,
+            url_params=kwargs,
+            query_params=query_params,
+            deserialized_data=deserialized_data,
+        )
+
+    return pipeline
+
+
+def _build_pipeline(view_function, allow_forms, deserializers_http_methods_map):
+    # type:(Callable, bool, Optional[Dict[str, ClassVar[Deserializer]]]) -> Callable
+    skips_deserialization, single_deserializer = _classify_deserializers(
+        deserializers_http_methods_map
+    )
+    if skips_deserialization:
+        return _build_skipping_pipeline(view_function, allow_forms)
+    if single_deserializer is not None:
+        return _build_single_deserializer_pipeline(
+            view_function, allow_forms, single_deserializer
+        )
+    return _build_deserializer_map_pipeline(
+        view_function, allow_forms, deserializers_http_methods_map
+    )
+
+
+def _with_permission_check(pipeline, has_permission, view_function):
+    # type:(Callable, Callable, Callable) -> Callable
+    def protected_pipeline(request, kwargs):
+        # type:(HttpRequest, Dict[str, Any]) -> JsonResponse
+        if not has_permission(request, view_function):
+            raise PermissionDenied
+        return pipeline(request, kwargs)
+
+    return protected_pipeline
+
+
+def _with_method_check(pipeline, allowed_methods):
+    # type:(Callable, Iterable[str]) -> Callable
+    def checked_pipeline(request, kwargs):
+        # type:(HttpRequest, Dict[str, Any]) -> JsonResponse
+        if request.method not in allowed_methods:
+            raise MethodNotAllowed
+        return pipeline(request, kwargs)
+
+    return checked_pipeline
 
 
 def build_function_wrapper(
@@ -90,38 +260,42 @@ def build_function_wrapper(
     allow_forms,  # type: bool
     view_function,  # Callable
 ):  # type:(...) -> Callable
+    # All the parameters are known at decoration time, so the checks whose
+    # outcome is already decided here (permissions, deserialization) are
+    # compiled out of the per-request closure instead of being re-evaluated
+    # on every call.
+
+    # Permissions are stateless: one instance built here is enough. `AllowAny`
+    # always passes, so its check is dropped from the wrapper entirely.
+    has_permission = (
+        None if permission_class is AllowAny else permission_class().has_permission
+    )
+    allowed_methods = _normalize_allowed_methods(allowed_methods)
+    pipeline = _build_pipeline(
+        view_function, allow_forms, deserializers_http_methods_map
+    )
+    if has_permission is not None:
+        pipeline = _with_permission_check(pipeline, has_permission, view_function)
+    pipeline = _with_method_check(pipeline, allowed_methods)
+
     @wraps(view_function)
     def function_wrapper(request, *args, **kwargs):
         # type:(HttpRequest, List[Any]) -> JsonResponse
         try:
-            if request.method not in allowed_methods:
-                raise MethodNotAllowed
-            if not permission_class().has_permission(request, view_function):
-                raise PermissionDenied
-            query_params = transform_query_dict_into_regular_dict(request.GET)
-            payload = extract_request_payload(request, allow_forms)
-            if request.method in SUPPORTING_PAYLOAD_METHODS:
-                deserializer = deserializers_http_methods_map[request.method](
-                    data=payload
-                )
-                if not deserializer.is_valid():
-                    raise BadRequest
-                deserialized_data = deserializer.data
-            else:
-                deserialized_data = None
-
-            return view_function(
-                request,
-                url_params=kwargs,
-                query_params=query_params,
-                deserialized_data=deserialized_data,
-            )
+            return pipeline(request, kwargs)
         except BaseAPIException as e:
-            return JsonResponse({"error_msg": e.RESPONSE_MESSAGE}, status=e.STATUS_CODE)
+            # The error body is rendered once per exception class: no dict
+            # allocation nor JSON serialization on the error path.
+            return HttpResponse(
+                e.get_response_bytes(),
+                status=e.STATUS_CODE,
+                content_type="application/json",
+            )
         except Exception:
-            return JsonResponse(
-                {"error_msg": InternalServerError.RESPONSE_MESSAGE},
+            return HttpResponse(
+                InternalServerError.get_response_bytes(),
                 status=InternalServerError.STATUS_CODE,
+                content_type="application/json",
             )
 
     return csrf_exempt(function_wrapper)
@@ -148,25 +322,33 @@ def build_class_wrapper(
                 allow_forms,
                 self._handle_request,
             )
+            # Bind the wrapped view's HTTP handlers once: request dispatching
+            # becomes a single dict lookup on the method name, and direct
+            # attribute access still works for the handlers themselves.
+            http_handlers = {}
+            for method, handler_name in LOWERCASE_METHODS_MAP.items():
+                handler = getattr(self._wrapped_view, handler_name, None)
+                if handler is not None:
+                    setattr(self, handler_name, handler)
+                    http_handlers[method] = handler
+            self._http_handlers = http_handlers
 
         def _handle_request(self, request, *args, **kwargs):
             # type:(HttpRequest, List[Any]) -> JsonResponse
             # No need for additional check on request.method, since it's been
             # already checked
-            handler = getattr(self, request.method.lower())
-            return handler(request, *args, **kwargs)
+            return self._http_handlers[request.method](request, *args, **kwargs)
 
         @csrf_exempt
         def dispatch(self, *args, **kwargs):
             # type:(HttpRequest, List[Any]) -> JsonResponse
             return self.compiled_dispatch(*args, **kwargs)
 
-        def __getattribute__(self, name):
-            try:
-                return super(ViewWrapper, self).__getattribute__(name)
-            except AttributeError:
-                attribute = self._wrapped_view.__getattribute__(name)
-                return attribute
+        def __getattr__(self, name):
+            # Only called when normal attribute lookup fails, so hot-path
+            # accesses (`compiled_dispatch`, bound handlers) don't pay for
+            # the delegation to the wrapped view.
+            return getattr(self._wrapped_view, name)
 
     ViewWrapper.__name__ = view_class.__name__
     return ViewWrapper
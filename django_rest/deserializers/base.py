@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 
-import six
 from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 from django.forms.fields import Field
 from django.forms.forms import DeclarativeFieldsMetaclass
-from django.forms.utils import ErrorDict, ErrorList
+from django.forms.utils import ErrorDict
+
+#: Shared "validation succeeded" marker. `add_error()` replaces it with a real
+#: `ErrorDict()` on first error, so the happy path allocates nothing. Strictly
+#: internal: `errors` swaps it for a per-instance dict before handing anything
+#: out, so no caller can mutate the shared marker.
+_NO_ERRORS = ErrorDict()
 
 
 class BaseDeserializer(Field):
@@ -33,17 +38,42 @@ class BaseDeserializer(Field):
         for name in cls.declared_fields:
             yield name, cls.declared_fields[name]
 
+    @classmethod
+    def _get_compiled_fields(cls):
+        # type:() -> Tuple[Tuple[str, Field, Optional[Callable]]]
+        """Returns the `(name, field, post_clean_method)` triples of the
+        current class, resolving the `post_clean_<name>` hooks only once
+        per class instead of once per field per validation.
+        """
+        try:
+            # `cls.__dict__` lookup, so that subclasses don't inherit the
+            # compiled fields of their parents.
+            return cls.__dict__["_compiled_clean_fields"]
+        except KeyError:
+            compiled_fields = tuple(
+                (name, field, getattr(cls, "post_clean_{}".format(name), None))
+                for name, field in cls.declared_fields.items()
+            )
+            cls._compiled_clean_fields = compiled_fields
+            return compiled_fields
+
     @property
     def errors(self):
         # type:() -> ErrorDict
         """Return an ErrorDict for the data provided for the deserializer."""
         if self._errors is None:
             self.full_clean()
+        if self._errors is _NO_ERRORS:
+            # The shared marker must never leak out: mutating the returned
+            # dict would poison every deserializer in the process.
+            self._errors = ErrorDict()
         return self._errors
 
     def is_valid(self):
         """Return True if the deserializer has no errors, or False otherwise."""
-        return not self.errors
+        if self._errors is None:
+            self.full_clean()
+        return not self._errors
 
     def _get_error_dict(self, field_name, error):
         # type:(str, ValidationError) -> Dict
@@ -59,6 +89,8 @@ class BaseDeserializer(Field):
         """
         Updates the content of `self._errors`. Each `self._errors` is a `dict` instance.
         """
+        if self._errors is _NO_ERRORS:
+            self._errors = ErrorDict()
         error = self._get_error_dict(field_name, error)
         for field_name, errors in error.items():
             self._errors[field_name] = errors
@@ -67,24 +99,25 @@ class BaseDeserializer(Field):
         """
         Clean all of self._data and populate self._errors and self._cleaned_data.
         """
-        self._errors = ErrorDict()
+        self._errors = _NO_ERRORS
         self._cleaned_data = {}
         self._clean_fields()
 
     def _clean_fields(self):
-        if self._data in self.empty_values:
+        # `is None` short-circuits before any `==` comparison runs on the
+        # (usually dict) data, unlike a `in self.empty_values` tuple scan.
+        if self._data is None or self._data == "":
             self._cleaned_data = self._data
             return
         if not isinstance(self._data, dict):
-            error_list = ErrorList(["This field should be an object."])
-            raise ValidationError(error_list)
-        for name, field in self.declared_fields.items():
+            raise ValidationError("This field should be an object.")
+        for name, field, post_clean in self._get_compiled_fields():
             value = self._data.get(name)
             try:
                 value = field.clean(value)
                 self._cleaned_data[name] = value
-                if hasattr(self, "post_clean_{}".format(name)):
-                    value = getattr(self, "post_clean_{}".format(name))(value)
+                if post_clean is not None:
+                    value = post_clean(self, value)
                     self._cleaned_data[name] = value
             except ValidationError as e:
                 if field.required:
@@ -104,19 +137,22 @@ class BaseDeserializer(Field):
         self.validate(data)
 
         self._init_data(data)
-        if self.errors:
-            raise ValidationError(self.errors)
+        if not self.is_valid():
+            raise ValidationError(self._errors)
         return self._cleaned_data
 
     @property
     def data(self):
         # type:() -> dict
-        if not self._cleaned_data:
+        # `self._errors` is only None before `full_clean()` has run: testing
+        # it (rather than the truthiness of `self._cleaned_data`) avoids
+        # re-validating legitimately empty cleaned data on every access.
+        if self._errors is None:
             self.full_clean()
         return self._cleaned_data
 
 
-class Deserializer(six.with_metaclass(DeclarativeFieldsMetaclass, BaseDeserializer)):
+class Deserializer(BaseDeserializer, metaclass=DeclarativeFieldsMetaclass):
     pass
 
 
@@ -125,6 +161,13 @@ class AllPassDeserializer(Deserializer):
     the data received as input.
     """
 
+    def is_valid(self):
+        # Any data is accepted: no need to run the full_clean machinery.
+        return True
+
     def _clean_fields(self):
-        for name, value in self._data.items():
-            self._cleaned_data[name] = value
+        # Aliasing instead of a per-key copy: "accept everything" doesn't
+        # need its own dict. Unconditional, so non-dict JSON payloads (e.g.
+        # a top-level list) come through exactly like on the paths that
+        # skip deserialization entirely.
+        self._cleaned_data = self._data
@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
 from django_rest.http import status
 
 
@@ -15,6 +20,22 @@ class BaseAPIException(Exception):
     STATUS_CODE = status.HTTP_500_INTERNAL_SERVER_ERROR
     RESPONSE_MESSAGE = "An unknown server error occured."
 
+    @classmethod
+    def get_response_bytes(cls):
+        # type:() -> bytes
+        """Returns the serialized JSON body of the error response. The body
+        is static per exception class, so it's rendered once and cached on
+        the class itself.
+        """
+        try:
+            return cls.__dict__["RESPONSE_BYTES"]
+        except KeyError:
+            response_bytes = json.dumps({"error_msg": cls.RESPONSE_MESSAGE})
+            if not isinstance(response_bytes, bytes):  # stdlib json fallback
+                response_bytes = response_bytes.encode()
+            cls.RESPONSE_BYTES = response_bytes
+            return response_bytes
+
 
 class BadRequest(BaseAPIException):
     STATUS_CODE = status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+from http.client import responses
+from http.cookies import SimpleCookie
+
+try:
+    import orjson as json  # `dumps()` returns ready-to-send bytes.
+except ImportError:
+    import json
+
+
+#: Reason phrases of the status codes covering virtually all API traffic,
+#: frozen at import so the usual case is one small-dict lookup instead of
+#: probing the full `http.client.responses` table.
+_COMMON_REASON_PHRASES = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    301: "Moved Permanently",
+    302: "Found",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    500: "Internal Server Error",
+}
+
+#: Default response headers, built once at import: maps the lowercased header
+#: name to its `(Name, value)` pair, so responses without additional headers
+#: pay neither `str.lower()` calls nor per-header tuple allocations.
+_DEFAULT_HEADERS = {"content-type": ("Content-Type", "application/json")}
+
+
+class JsonResponse(object):
+    """A lightweight HTTP response serializing its content to JSON.
+
+    The content is serialized with `orjson` when available: it's several
+    times faster than the stdlib encoder and produces bytes directly,
+    skipping the str -> bytes encode pass of the response body.
+
+    The class deliberately doesn't inherit from `django.http.HttpResponse`:
+    it implements just enough of its interface (headers access, cookies,
+    iteration, resource closers, `serialize_headers()`) for Django's
+    handlers, without the generic header-manipulation machinery on the hot
+    path. No `__slots__` though: the handlers and the test client attach
+    arbitrary attributes (`_handler_class`, `wsgi_request`, ..) to the
+    responses they carry.
+    """
+
+    streaming = False
+
+    #: Set by Django's WSGI handler on every response it serves.
+    _handler_class = None
+
+    def __init__(self, content, status=200, additional_headers=None):
+        serialized_content = json.dumps(content)
+        if not isinstance(serialized_content, bytes):  # stdlib json fallback
+            serialized_content = serialized_content.encode()
+        self.content = serialized_content
+        self.status_code = status
+        self.reason_phrase = _COMMON_REASON_PHRASES.get(status) or responses.get(
+            status, "Unknown Status Code"
+        )
+        headers = dict(_DEFAULT_HEADERS)
+        if additional_headers:
+            for name, value in additional_headers.items():
+                headers[name.lower()] = (name, value)
+        self._headers = headers
+        self.cookies = SimpleCookie()
+        self._closable_objects = []
+        # Django's base handler appends `request.close` here (since 3.0).
+        self._resource_closers = []
+
+    def __getitem__(self, header):
+        # type:(str) -> str
+        return self._headers[header.lower()][1]
+
+    def __setitem__(self, header, value):
+        # type:(str, str) -> None
+        self._headers[header.lower()] = (header, value)
+
+    def __delitem__(self, header):
+        # type:(str) -> None
+        self._headers.pop(header.lower(), None)
+
+    def has_header(self, header):
+        # type:(str) -> bool
+        return header.lower() in self._headers
+
+    __contains__ = has_header
+
+    def get(self, header, alternate=None):
+        # type:(str, Optional[str]) -> Optional[str]
+        try:
+            return self._headers[header.lower()][1]
+        except KeyError:
+            return alternate
+
+    def setdefault(self, header, value):
+        # type:(str, str) -> None
+        self._headers.setdefault(header.lower(), (header, value))
+
+    @property
+    def headers(self):
+        # The response already implements the whole mapping interface over
+        # its headers, so it stands in for the `HttpResponse.headers`
+        # accessor that Django >= 3.2 middlewares use, with no extra object.
+        return self
+
+    def items(self):
+        # type:() -> Iterable[Tuple[str, str]]
+        return self._headers.values()
+
+    def serialize_headers(self):
+        # type:() -> bytes
+        return b"\r\n".join(
+            "{}: {}".format(name, value).encode("latin-1")
+            for name, value in self._headers.values()
+        )
+
+    def __iter__(self):
+        yield self.content
+
+    def close(self):
+        for closer in self._resource_closers:
+            try:
+                closer()
+            except Exception:
+                pass
+        self._resource_closers.clear()
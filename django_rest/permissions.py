@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-import six
+from functools import lru_cache
 
 from django_rest.http.methods import SAFE_METHODS
 
@@ -24,10 +24,21 @@ class MetaOperand(type):
 
     def __and__(first_class, second_class):
         # type:(ClassVar, ClassVar) -> ClassVar
+        # Algebraic identities: `P & AllowAny == P` and `P & P == P`, so no
+        # wrapper class is built at all for those compositions.
+        if second_class is AllowAny or first_class is second_class:
+            return first_class
+        if first_class is AllowAny:
+            return second_class
         return AND.build_permission_from(first_class, second_class)
 
     def __or__(first_class, second_class):
         # type:(ClassVar, ClassVar) -> ClassVar
+        # `AllowAny` is the dominant element of `|`: `P | AllowAny == AllowAny`.
+        if first_class is AllowAny or second_class is AllowAny:
+            return AllowAny
+        if first_class is second_class:
+            return first_class
         return OR.build_permission_from(first_class, second_class)
 
     def __xor__(first_class, second_class):
@@ -36,9 +47,55 @@ class MetaOperand(type):
 
     def __invert__(first_class):
         # type:(ClassVar, ClassVar) -> ClassVar
+        # Double negation: `~~P == P`.
+        operator_tree = first_class.__dict__.get("_operator_tree")
+        if operator_tree is not None and operator_tree[0] is NOT:
+            return operator_tree[1]
         return NOT.build_permission_from(first_class)
 
 
+# == Operator-tree flattening
+
+
+def _flatten_permission_expression(permission_class, leaf_functions):
+    # type:(ClassVar, Dict[str, Callable]) -> str
+    """Returns the python expression evaluating `permission_class`, written
+    over the bound leaf `has_permission` functions collected into
+    `leaf_functions`. Composites built from operators that define
+    `EXPRESSION_FORMAT` are recursively inlined; any other permission class
+    is treated as a leaf.
+    """
+    # `__dict__` lookup (like `__invert__` above): a user subclass of a
+    # composite inherits the parent's tree but overrides `has_permission`,
+    # so it must be treated as a leaf, not flattened to the parent's logic.
+    operator_tree = permission_class.__dict__.get("_operator_tree")
+    if operator_tree is not None and operator_tree[0].EXPRESSION_FORMAT is not None:
+        child_expressions = [
+            _flatten_permission_expression(child, leaf_functions)
+            for child in operator_tree[1:]
+        ]
+        return operator_tree[0].EXPRESSION_FORMAT.format(*child_expressions)
+
+    leaf_name = "permission_func_{}".format(len(leaf_functions))
+    leaf_functions[leaf_name] = permission_class().has_permission
+    return "{}(request, view)".format(leaf_name)
+
+
+def _compile_flat_has_permission(permission_class):
+    # type:(ClassVar) -> Callable
+    """Collapses the whole operator tree of `permission_class` into a single
+    short-circuit expression (runtime code-generation), so that a depth-k
+    composition costs one Python frame per check instead of k.
+    """
+    leaf_functions = {}
+    expression = _flatten_permission_expression(permission_class, leaf_functions)
+    source = "def has_permission(self, request, view):\n    return {}".format(
+        expression
+    )
+    exec(compile(source, "<django_rest.permissions>", "exec"), leaf_functions)
+    return leaf_functions["has_permission"]
+
+
 # == Abstract operators
 
 
@@ -69,6 +126,12 @@ class BinaryOperator(object):
     with the `+`, it should be assigned in the `__add__` method of `MetaOperand`
     """
 
+    #: Optional format string of the operator's python expression (e.g.
+    #: "({} and {})"). When defined, composite trees using the operator are
+    #: flattened into a single compiled closure; when None, the operator
+    #: falls back to its `calculate()` method.
+    EXPRESSION_FORMAT = None
+
     @staticmethod
     def calculate(first_function, second_function, *args, **kwargs):
         # type:(Callable, Callable, *Any, **Any) -> bool
@@ -79,28 +142,38 @@ class BinaryOperator(object):
     @classmethod
     def build_classname(cls, class_1, class_2):
         # type:(ClassVar, ClassVar) -> str
-        return "({}{}{})".format(class_1.__name__, cls.OPERATOR_NAME, class_2.__name__)
+        return f"({class_1.__name__}{cls.OPERATOR_NAME}{class_2.__name__})"
 
     @classmethod
     def build_docstring(cls, class_1, class_2):
         # type:(ClassVar, ClassVar) -> str
-        return "\t({})\n\t{}\n\t({})".format(
-            class_1.__doc__, cls.OPERATOR_NAME, class_2.__doc__
-        )
+        return f"\t({class_1.__doc__})\n\t{cls.OPERATOR_NAME}\n\t({class_2.__doc__})"
 
     @classmethod
+    @lru_cache(maxsize=None)
     def build_permission_from(cls, permission_class_1, permission_class_2):
         # type:(ClassVar, ClassVar) -> ClassVar
+        # Memoized on the operand classes' identity: re-evaluating the same
+        # permission expression reuses the already-built class instead of
+        # paying the metaclass construction and name/docstring formatting.
         result_classname = cls.build_classname(permission_class_1, permission_class_2)
         result_class = MetaOperand(result_classname, (BasePermission,), {})
         result_class.__doc__ = cls.build_docstring(
             permission_class_1, permission_class_2
         )
+        result_class._operator_tree = (cls, permission_class_1, permission_class_2)
+
+        if cls.EXPRESSION_FORMAT is not None:
+            result_class.has_permission = _compile_flat_has_permission(result_class)
+            return result_class
+
+        # Permissions are stateless: the operands are instantiated once here
+        # instead of on every `has_permission()` call.
+        permission_func_1 = permission_class_1().has_permission
+        permission_func_2 = permission_class_2().has_permission
 
         def has_permission(self, request, view):
             # type:(HttpRequest, Callable) -> bool
-            permission_func_1 = permission_class_1().has_permission
-            permission_func_2 = permission_class_2().has_permission
             return cls.calculate(permission_func_1, permission_func_2, request, view)
 
         result_class.has_permission = has_permission
@@ -131,6 +204,9 @@ class UnaryOperator(object):
 
     OPERATOR_NAME = None
 
+    #: Same contract as `BinaryOperator.EXPRESSION_FORMAT`.
+    EXPRESSION_FORMAT = None
+
     @staticmethod
     def calculate(function, *args, **kwargs):
         # type:(Callable, *Any, **Any) -> bool
@@ -141,23 +217,30 @@ class UnaryOperator(object):
     @classmethod
     def build_classname(cls, _class):
         # type:(ClassVar) -> str
-        return "({}{})".format(cls.OPERATOR_NAME, _class.__name__)
+        return f"({cls.OPERATOR_NAME}{_class.__name__})"
 
     @classmethod
     def build_docstring(cls, _class):
         # type:(ClassVar, ClassVar) -> str
-        return "\t{}({})".format(cls.OPERATOR_NAME, _class.__doc__)
+        return f"\t{cls.OPERATOR_NAME}({_class.__doc__})"
 
     @classmethod
+    @lru_cache(maxsize=None)
     def build_permission_from(cls, permission_class):
         # type:(ClassVar) -> ClassVar
         result_classname = cls.build_classname(permission_class)
         result_class = MetaOperand(result_classname, (BasePermission,), {})
         result_class.__doc__ = cls.build_docstring(permission_class)
+        result_class._operator_tree = (cls, permission_class)
+
+        if cls.EXPRESSION_FORMAT is not None:
+            result_class.has_permission = _compile_flat_has_permission(result_class)
+            return result_class
+
+        permission_func = permission_class().has_permission
 
         def has_permission(self, request, view):
             # type:(HttpRequest, Callable) -> bool
-            permission_func = permission_class().has_permission
             return cls.calculate(permission_func, request, view)
 
         result_class.has_permission = has_permission
@@ -167,7 +250,7 @@ class UnaryOperator(object):
 # == Concrete operators
 
 
-class AND(six.with_metaclass(MetaOperand, BinaryOperator)):
+class AND(BinaryOperator, metaclass=MetaOperand):
     """AND Logical operator class.
 
     Example of use:
@@ -175,9 +258,14 @@ class AND(six.with_metaclass(MetaOperand, BinaryOperator)):
         ResultPermClass = AND.build_permission_from(PermClass1, PermClass2)
         # Which is also equivalend to:
         ResultPermClass = PermClass1 & PermClass2
+
+    `calculate()` receives the operand functions (not their results) exactly
+    so that the `and` short-circuits: the second permission is never evaluated
+    when the first one already fails.
     """
 
     OPERATOR_NAME = "_AND_"
+    EXPRESSION_FORMAT = "({} and {})"
 
     @staticmethod
     def calculate(first_function, second_function, *args, **kwargs):
@@ -185,7 +273,7 @@ class AND(six.with_metaclass(MetaOperand, BinaryOperator)):
         return first_function(*args, **kwargs) and second_function(*args, **kwargs)
 
 
-class OR(six.with_metaclass(MetaOperand, BinaryOperator)):
+class OR(BinaryOperator, metaclass=MetaOperand):
     """OR Logical operator class.
 
     Example of use:
@@ -193,9 +281,13 @@ class OR(six.with_metaclass(MetaOperand, BinaryOperator)):
         ResultPermClass = OR.build_permission_from(PermClass1, PermClass2)
         # Which is also equivalend to:
         ResultPermClass = PermClass1 | PermClass2
+
+    Like `AND`, the `or` short-circuits: the second permission is only
+    evaluated when the first one denies access.
     """
 
     OPERATOR_NAME = "_OR_"
+    EXPRESSION_FORMAT = "({} or {})"
 
     @staticmethod
     def calculate(first_function, second_function, *args, **kwargs):
@@ -203,7 +295,7 @@ class OR(six.with_metaclass(MetaOperand, BinaryOperator)):
         return first_function(*args, **kwargs) or second_function(*args, **kwargs)
 
 
-class XOR(six.with_metaclass(MetaOperand, BinaryOperator)):
+class XOR(BinaryOperator, metaclass=MetaOperand):
     """XOR (eXclusive OR) Logical operator class.
 
     Example of use:
@@ -211,9 +303,13 @@ class XOR(six.with_metaclass(MetaOperand, BinaryOperator)):
         ResultPermClass = XOR.build_permission_from(PermClass1, PermClass2)
         # Which is also equivalend to:
         ResultPermClass = PermClass1 ^ PermClass2
+
+    Unlike `AND`/`OR`, xor cannot short-circuit: both permissions are always
+    evaluated.
     """
 
     OPERATOR_NAME = "_XOR_"
+    EXPRESSION_FORMAT = "({} ^ {})"
 
     @staticmethod
     def calculate(first_function, second_function, *args, **kwargs):
@@ -221,7 +317,7 @@ class XOR(six.with_metaclass(MetaOperand, BinaryOperator)):
         return first_function(*args, **kwargs) ^ second_function(*args, **kwargs)
 
 
-class NOT(six.with_metaclass(MetaOperand, UnaryOperator)):
+class NOT(UnaryOperator, metaclass=MetaOperand):
     """NOT Logical operator class.
 
     Example of use:
@@ -232,6 +328,7 @@ class NOT(six.with_metaclass(MetaOperand, UnaryOperator)):
     """
 
     OPERATOR_NAME = "NOT_"
+    EXPRESSION_FORMAT = "(not {})"
 
     @staticmethod
     def calculate(function, *args, **kwargs):
@@ -239,7 +336,7 @@ class NOT(six.with_metaclass(MetaOperand, UnaryOperator)):
         return not function(*args, **kwargs)
 
 
-class BasePermission(six.with_metaclass(MetaOperand, object)):
+class BasePermission(object, metaclass=MetaOperand):
     """
     The Mainclass of all existing permissions. It's created with `MetaOperand`,
     which allows it to use operators such as: `&`, `|` `^` and `~`.
@@ -258,13 +355,31 @@ class BasePermission(six.with_metaclass(MetaOperand, object)):
             "`has_permission()` method should be defined in subclasses"
         )
 
+# == Concrete permissions
+
+
+def _is_authenticated(request):
+    # type:(HttpRequest) -> bool
+    """Returns whether the request's user is authenticated, memoizing the
+    answer on the request itself: `request.user` is a lazy object that may
+    hit the session/DB when first touched, and a composite permission can
+    consult it several times for a single request.
+    """
+    cached = getattr(request, "_cached_is_authenticated", None)
+    if isinstance(cached, bool):
+        return cached
+    is_authenticated = bool(request.user and request.user.is_authenticated)
+    request._cached_is_authenticated = is_authenticated
+    return is_authenticated
+
 
 class AllowAny(BasePermission):
     """
     Allows everybody to access the view.
     """
 
-    def has_permission(self, request, view):
+    @staticmethod
+    def has_permission(request, view):
         # type:(HttpRequest, Callable) -> bool
         return True
 
@@ -274,9 +389,10 @@ class IsAuthenticated(BasePermission):
     Allows the view access to authenticated users only.
     """
 
-    def has_permission(self, request, view):
+    @staticmethod
+    def has_permission(request, view):
         # type:(HttpRequest, Callable) -> bool
-        return bool(request.user and request.user.is_authenticated)
+        return _is_authenticated(request)
 
 
 class IsStaffUser(BasePermission):
@@ -284,8 +400,12 @@ class IsStaffUser(BasePermission):
     Allows the view access to staff users only.
     """
 
-    def has_permission(self, request, view):
+    @staticmethod
+    def has_permission(request, view):
         # type:(HttpRequest, Callable) -> bool
+        # No `_is_authenticated()` here: the baseline predicate only needs a
+        # truthy user, and custom user objects may expose `is_staff` without
+        # `is_authenticated`.
         return bool(request.user and request.user.is_staff)
 
 
@@ -294,7 +414,8 @@ class IsAdminUser(BasePermission):
     Allows the view access to admin users only.
     """
 
-    def has_permission(self, request, view):
+    @staticmethod
+    def has_permission(request, view):
         # type:(HttpRequest, Callable) -> bool
         return bool(request.user and request.user.is_superuser)
 
@@ -304,7 +425,8 @@ class IsReadOnly(BasePermission):
     Allows the view access to read-only http methods: GET, HEAD and OPTIONS.
     """
 
-    def has_permission(self, request, view):
+    @staticmethod
+    def has_permission(request, view):
         # type:(HttpRequest, Callable) -> bool
         return request.method in SAFE_METHODS
 
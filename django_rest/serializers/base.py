@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
-import types
+#: Sentinel that a getter may return to drop its field from the serialized
+#: result: `Serializer._serialize()` tests for it with a pointer comparison,
+#: which is far cheaper than raising an exception as control flow.
+_SKIP = object()
 
 
 class Field(object):
@@ -50,13 +53,20 @@ class Field(object):
 
     to_value._base_implementation = True
 
+    #: Whether `to_value` is overridden on the class. Recomputed once per
+    #: subclass in `__init_subclass__`, so serializer compilation reads a
+    #: plain class attribute instead of probing the method at each field.
+    _to_value_overridden = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._to_value_overridden = not getattr(
+            cls.to_value, "_base_implementation", False
+        )
+
     def _is_to_value_overridden(self):
         # type:() -> bool
-        to_value = self.to_value
-        # If to_value isn't a method, it must have been overridden.
-        if not isinstance(to_value, types.MethodType):
-            return True
-        return not getattr(to_value, "_base_implementation", False)
+        return self._to_value_overridden
 
     def as_getter(self, serializer_field_name, serializer_cls):
         # type:(str, type) -> Optional[Callable]
@@ -84,4 +94,13 @@ class Field(object):
 
 
 class SerializerBase(Field):
+    __slots__ = ()
+
     _field_map = {}
+
+    def __init_subclass__(cls, **kwargs):
+        # Each subclass owns its field mapping: mutating one serializer's map
+        # can never leak into its siblings through the shared base dict.
+        # (`SerializerMeta` overwrites it right after with the real fields.)
+        super().__init_subclass__(**kwargs)
+        cls._field_map = {}
@@ -1,21 +1,10 @@
 # -*- coding: utf-8 -*-
 
-import types
-
-import six
-
 from django_rest.serializers.serializers import Serializer
-from django_rest.serializers.base import Field
+from django_rest.serializers.base import _SKIP, Field
 from django_rest.serializers.exceptions import SerializationError
 
-if six.PY34:
-    from collections.abc import Iterable, Mapping  # pragma: no cover
-else:
-    from collections import Iterable, Mapping  # pragma: no cover
-
-
 NoneType = type(None)
-UnicodeType = types.UnicodeType if six.PY2 else str
 
 
 PRIMITIVE_TYPES = (
@@ -24,19 +13,23 @@ PRIMITIVE_TYPES = (
     float,
     str,
     NoneType,
-    UnicodeType,
 )
+#  Concrete types only: probing the abstract `Iterable`/`Mapping` classes
+#  invokes their `__subclasshook__`, which is orders of magnitude slower
+#  than a plain type check.
 ITERABLE_TYPES = (
-    Iterable,
-    Mapping,
+    list,
+    tuple,
+    set,
+    frozenset,
 )
-ALLOWED_CONSTANT_TYPES = ITERABLE_TYPES + PRIMITIVE_TYPES
+ALLOWED_CONSTANT_TYPES = ITERABLE_TYPES + (dict,) + PRIMITIVE_TYPES
 
 
 class CharField(Field):
     """ Field that converts the attribute's value into a string. """
 
-    to_value = staticmethod(six.text_type)
+    to_value = staticmethod(str)
 
 
 class IntegerField(Field):
@@ -72,6 +65,12 @@ def _is_valid_field_instance(field_instance):
     )
 
 
+#: Memoizes the classes generated by `ListField()`: repeated declarations like
+#: `ListField(CharField())` re-use one type object instead of paying a class
+#: creation each time. Only populated for class-level (staticmethod) to_value.
+_LIST_FIELD_CLASSES = {}
+
+
 def ListField(field_instance):
     # type:(Field) -> Field
     """Allows to apply the Field.to_value() method on an iterable of values,
@@ -97,17 +96,26 @@ def ListField(field_instance):
     """
     _is_valid_field_instance(field_instance)
     field_class = field_instance.__class__
-    ListFieldClass = type(
-        "List{}".format(field_class.__name__),
-        (field_class,),
-        {"__doc__": field_class.__doc__},
-    )
+    inner_to_value = field_instance.to_value
+    # The generated class is shareable only when `to_value` doesn't depend on
+    # the given instance, i.e. when it's the class-level (staticmethod) one.
+    is_shareable = inner_to_value is getattr(field_class, "to_value", None)
+    ListFieldClass = _LIST_FIELD_CLASSES.get(field_class) if is_shareable else None
+    if ListFieldClass is None:
+        ListFieldClass = type(
+            "List{}".format(field_class.__name__),
+            (field_class,),
+            {"__doc__": field_class.__doc__},
+        )
+
+        def to_value(value, _inner=inner_to_value):
+            # `map` dispatches to `_inner` in C: no per-element bytecode.
+            return list(map(_inner, value))
+
+        ListFieldClass.to_value = staticmethod(to_value)
+        if is_shareable:
+            _LIST_FIELD_CLASSES[field_class] = ListFieldClass
     attrs = {name: getattr(field_instance, name) for name in field_instance.__slots__}
-
-    def to_value(value):
-        return [field_instance.to_value(v) for v in value]
-
-    ListFieldClass.to_value = staticmethod(to_value)
     return ListFieldClass(**attrs)
 
 
@@ -153,33 +161,32 @@ class ConstantField(Field):
 
     def as_getter(self, serializer_field_name, serializer_cls):
         # type:(str, Serializer) -> Callable
-        constant = self.constant
-
-        def getter(obj):
-            if not self._is_primitive and not self.required:
-                # This raise will make the `_serialize` method `continue` the
-                # loop without saving the current field
-                raise TypeError(
-                    "Non-required field: Non primitive constant given: {}".format(
-                        constant.__class__.__name__
-                    )
-                )
-            return constant
+        if not self._is_primitive and not self.required:
+            # Returning `_SKIP` makes `_serialize()` drop the field, without
+            # paying an exception raise/catch per serialized instance.
+            def getter(obj):
+                return _SKIP
+
+            return getter
+
+        def getter(obj, _constant=self.constant):
+            # Bound as default argument: a local read, not a closure-cell one.
+            return _constant
 
         return getter
 
     @classmethod
     def _is_primitive_const(cls, constant):
         # type:(Any) -> bool
-        if not isinstance(constant, ALLOWED_CONSTANT_TYPES):
-            return False
-
         if isinstance(constant, PRIMITIVE_TYPES):
             return True
 
-        if isinstance(constant, Mapping):
+        if not isinstance(constant, ALLOWED_CONSTANT_TYPES):
+            return False
+
+        if isinstance(constant, dict):
             keys_are_primitive = all(
-                isinstance(key, (str, UnicodeType)) for key in constant.keys()
+                isinstance(key, str) for key in constant.keys()
             )
             return keys_are_primitive and all(
                 cls._is_primitive_const(value) for value in constant.values()
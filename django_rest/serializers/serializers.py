@@ -1,25 +1,83 @@
 # -*- coding: utf-8 -*-
 
+import keyword
 import operator
+import sys
+from types import MappingProxyType
 
-import six
+try:
+    import orjson as json  # `dumps()` returns ready-to-send bytes.
+except ImportError:
+    import json
 
-from django_rest.serializers.base import Field, SerializerBase
+from django_rest.serializers.base import _SKIP, Field, SerializerBase
 from django_rest.serializers.exceptions import SerializationError
 
 
+#: Errors catchable during a field serialization. A missing/invalid value
+#: raises `SerializationError` when the field is required, and skips the
+#: field otherwise.
+_FIELD_ERRORS = (KeyError, AttributeError, TypeError, ValueError)
+
+
+def _build_dotted_attrs_getter(attr_name):
+    # type:(str) -> Callable
+    """Generates a getter for a dotted attributes chain, e.g. `"sub.x"`.
+
+    The generated `lambda obj: obj.sub.x` compiles to plain LOAD_ATTR
+    bytecodes, which hit CPython's inline attribute caches, where
+    `operator.attrgetter("sub.x")` goes through a generic C loop over the
+    pre-split path on every call.
+    """
+    return eval("lambda obj: obj.{}".format(attr_name), {})
+
+
 def _compile_field_to_tuple(field, serializer_field_name, serializer_cls):
     getter = field.as_getter(serializer_field_name, serializer_cls)
     if getter is None:
-        getter = serializer_cls.default_getter(field.attr_name or serializer_field_name)
+        attr_name = field.attr_name or serializer_field_name
+        default_getter = serializer_cls.default_getter
+        if (
+            not field.required
+            and default_getter is operator.attrgetter
+            and "." not in attr_name
+        ):
+            # A missing attribute on an optional field just skips the field:
+            # fetching with a `_SKIP` default avoids paying an exception
+            # raise/catch per serialized instance for that common case.
+            def getter(obj, _attr_name=attr_name):
+                return getattr(obj, _attr_name, _SKIP)
+
+        elif not field.required and default_getter is operator.itemgetter:
+
+            def getter(obj, _attr_name=attr_name):
+                return obj.get(_attr_name, _SKIP)
+
+        elif (
+            default_getter is operator.attrgetter
+            and "." in attr_name
+            and all(
+                # `isidentifier()` accepts keywords ("sub.class", ..), which
+                # `attrgetter` resolves fine but `eval` would reject.
+                part.isidentifier() and not keyword.iskeyword(part)
+                for part in attr_name.split(".")
+            )
+        ):
+            getter = _build_dotted_attrs_getter(attr_name)
+        else:
+            getter = default_getter(attr_name)
 
     # Only set a to_value function if it has been overridden for performance.
+    # `_to_value_overridden` is computed once per Field subclass, at its
+    # definition: reading it here is a plain class-attribute lookup.
     to_value = None
-    if field._is_to_value_overridden():
+    if field._to_value_overridden:
         to_value = field.to_value
 
     # Set the field name to a supplied label; defaults to the attribute name.
-    name = field.label or serializer_field_name
+    # Interned, so the per-instance dict inserts (and downstream lookups)
+    # hit the identity-comparison fast path of string keys.
+    name = sys.intern(field.label or serializer_field_name)
 
     return (
         name,
@@ -31,6 +89,173 @@ def _compile_field_to_tuple(field, serializer_field_name, serializer_cls):
     )
 
 
+def _bind_field_callables(index, compiled_field, namespace, parameters):
+    # type:(int, Tuple, dict, list) -> Tuple[str, str, Optional[str]]
+    """Binds a field's name/getter/to_value objects into the generated
+    function's namespace, and returns the parameter names holding them.
+    """
+    name, getter, to_value = compiled_field[:3]
+    name_var = "_name{}".format(index)
+    getter_var = "_getter{}".format(index)
+    namespace[name_var] = name
+    namespace[getter_var] = getter
+    parameters += [name_var, getter_var]
+    to_value_var = None
+    if to_value is not None:
+        to_value_var = "_to_value{}".format(index)
+        namespace[to_value_var] = to_value
+        parameters.append(to_value_var)
+    return name_var, getter_var, to_value_var
+
+
+def _build_value_expression(getter_var, to_value_var, call):
+    # type:(str, Optional[str], bool) -> str
+    value_expr = "{}(instance)".format(getter_var)
+    if call:
+        value_expr += "()"
+    if to_value_var is not None:
+        value_expr = "{}({})".format(to_value_var, value_expr)
+    return value_expr
+
+
+def _required_prefix_length(compiled_fields):
+    # type:(Tuple) -> int
+    """Length of the leading run of required, non-`pass_self` fields."""
+    prefix_length = 0
+    for (_, _, _, _, required, pass_self) in compiled_fields:
+        if not required or pass_self:
+            break
+        prefix_length += 1
+    return prefix_length
+
+
+def _emit_prefix_lines(
+    compiled_fields, prefix_length, covers_all_fields, namespace, parameters
+):
+    # type:(Tuple, int, bool, dict, list) -> List[str]
+    """Emits the leading run of required plain fields as one dict literal.
+
+    Those fields either serialize or raise, so they collapse into a single
+    expression under one shared try/except, building the dict at its final
+    size in one BUILD_MAP instead of growing it item by item. All-required
+    serializers (the common case) reduce entirely to that expression.
+    """
+    items = []
+    for index in range(prefix_length):
+        name_var, getter_var, to_value_var = _bind_field_callables(
+            index, compiled_fields[index], namespace, parameters
+        )
+        call = compiled_fields[index][3]
+        items.append(
+            "{}: {}".format(
+                name_var, _build_value_expression(getter_var, to_value_var, call)
+            )
+        )
+    dict_literal = "{{{}}}".format(", ".join(items))
+    if covers_all_fields:
+        return [
+            "    try:",
+            "        return {}".format(dict_literal),
+            "    except _FIELD_ERRORS as e:",
+            "        raise SerializationError(e)",
+        ]
+    if prefix_length:
+        return [
+            "    try:",
+            "        serialized_value = {}".format(dict_literal),
+            "    except _FIELD_ERRORS as e:",
+            "        raise SerializationError(e)",
+        ]
+    return ["    serialized_value = {}"]
+
+
+def _emit_field_lines(index, compiled_field, namespace, parameters):
+    # type:(int, Tuple, dict, list) -> List[str]
+    """Emits the try/except block serializing one field past the prefix."""
+    _, _, to_value, call, required, pass_self = compiled_field
+    name_var, getter_var, to_value_var = _bind_field_callables(
+        index, compiled_field, namespace, parameters
+    )
+    lines = ["    try:"]
+    if pass_self:
+        # `pass_self` getters (MethodField, ..) receive the serializer and
+        # produce the final value themselves: no call/to_value conversion.
+        lines.append(
+            "        serialized_value[{}] = {}(self, instance)".format(
+                name_var, getter_var
+            )
+        )
+    elif required:
+        # Required fields always go through call/to_value: one expression.
+        lines.append(
+            "        serialized_value[{}] = {}".format(
+                name_var,
+                _build_value_expression(getter_var, to_value_var, call),
+            )
+        )
+    else:
+        # Optional field: a `_SKIP` getter result drops the field, and
+        # `None` skips the conversion but is still rendered.
+        lines.append("        result = {}(instance)".format(getter_var))
+        lines.append("        if result is not _SKIP:")
+        if call or to_value:
+            conversion_expr = "result"
+            if call:
+                conversion_expr += "()"
+            if to_value_var is not None:
+                conversion_expr = "{}({})".format(to_value_var, conversion_expr)
+            lines += [
+                "            if result is not None:",
+                "                result = {}".format(conversion_expr),
+            ]
+        lines.append("            serialized_value[{}] = result".format(name_var))
+    if required:
+        lines += [
+            "    except _FIELD_ERRORS as e:",
+            "        raise SerializationError(e)",
+        ]
+    else:
+        lines += ["    except _FIELD_ERRORS:", "        pass"]
+    return lines
+
+
+def _build_serialize_function(compiled_fields):
+    # type:(Tuple) -> Callable
+    """Generates the `_serialize()` function of a Serializer class.
+
+    Instead of a generic loop re-unpacking each compiled-field tuple and
+    re-testing its `call`/`to_value`/`required`/`pass_self` flags on every
+    serialized instance, the function is generated once per class (at class
+    definition, by `SerializerMeta`) as straight-line code: the flags are
+    resolved while emitting the source, and the getter/to_value callables
+    are bound through default arguments, i.e. fast local lookups.
+    """
+    parameters = []
+    namespace = {
+        "_FIELD_ERRORS": _FIELD_ERRORS,
+        "_SKIP": _SKIP,
+        "SerializationError": SerializationError,
+    }
+
+    prefix_length = _required_prefix_length(compiled_fields)
+    covers_all_fields = bool(compiled_fields) and prefix_length == len(compiled_fields)
+    lines = _emit_prefix_lines(
+        compiled_fields, prefix_length, covers_all_fields, namespace, parameters
+    )
+    for index in range(prefix_length, len(compiled_fields)):
+        lines += _emit_field_lines(
+            index, compiled_fields[index], namespace, parameters
+        )
+    if not covers_all_fields:
+        lines.append("    return serialized_value")
+
+    default_args = "".join(", {0}={0}".format(param) for param in parameters)
+    header = "def _serialize(self, instance{}):".format(default_args)
+    source = "\n".join([header] + lines)
+    exec(source, namespace)
+    return namespace["_serialize"]
+
+
 class SerializerMeta(type):
     @staticmethod
     def _get_fields(direct_fields, serializer_cls):
@@ -65,12 +290,19 @@ class SerializerMeta(type):
         field_map = cls._get_fields(direct_fields, real_cls)
         compiled_fields = cls._compile_fields(field_map, real_cls)
 
-        real_cls._field_map = field_map
+        # Everything below is computed exactly once, at class creation; the
+        # read-only proxy locks the invariant in, so no later mutation can
+        # get out of sync with the generated `_serialize()`.
+        real_cls._field_map = MappingProxyType(field_map)
+        # The compiled tuples (name/getter/to_value/flags) are consumed here,
+        # at class-definition time only: the flags are burned into the
+        # generated `_serialize()`, so nothing unpacks them per instance.
         real_cls._compiled_fields = tuple(compiled_fields)
+        real_cls._serialize = _build_serialize_function(real_cls._compiled_fields)
         return real_cls
 
 
-class Serializer(six.with_metaclass(SerializerMeta, SerializerBase)):
+class Serializer(SerializerBase, metaclass=SerializerMeta):
     """The Serializer class is used as a base for custom serializers.
 
     A Serializer class is also a subclass of Field class, which allows nesting
@@ -92,6 +324,11 @@ class Serializer(six.with_metaclass(SerializerMeta, SerializerBase)):
         to serialize it as a list.
     """
 
+    #: Slot descriptors make the `instance`/`many`/`_data` reads C slot
+    #: loads. Subclasses (built by `SerializerMeta`) don't declare
+    #: `__slots__`, so they keep an instance `__dict__` for arbitrary attrs.
+    __slots__ = ("instance", "many", "_data")
+
     #: The default getter used if `Field.as_getter()` returns None.
     default_getter = operator.attrgetter
 
@@ -101,35 +338,29 @@ class Serializer(six.with_metaclass(SerializerMeta, SerializerBase)):
         self.many = many
         self._data = None
 
-    def _serialize(self, instance, fields):
-        # Transforms the `instance` object into its serialized value, by using
-        # the `fields` list parameter.
-        serialized_value = {}
-        for name, getter, to_value, call, required, pass_self in fields:
-            try:
-                if pass_self:
-                    result = getter(self, instance)
-                else:
-                    result = getter(instance)
-                    if required or result is not None:
-                        if call:
-                            result = result()
-                        if to_value:
-                            result = to_value(result)
-            except (KeyError, AttributeError, TypeError, ValueError) as e:
-                if required:
-                    raise SerializationError(str(e))
-            else:
-                serialized_value[name] = result
-
-        return serialized_value
+    # `_serialize(self, instance)` transforms the `instance` object into its
+    # serialized value. It is generated per class by `SerializerMeta`, through
+    # the `_build_serialize_function()` function above.
 
     def to_value(self, instance):
-        fields = self._compiled_fields
         if self.many:
             serialize = self._serialize
-            return [serialize(o, fields) for o in instance]
-        return self._serialize(instance, fields)
+            return [serialize(o) for o in instance]
+        return self._serialize(instance)
+
+    def to_json(self):
+        # type:() -> bytes
+        """Serializes the instance straight to JSON bytes.
+
+        One-shot shortcut for consumers that only need the JSON body (e.g.
+        building an HTTP response): the serialized dicts feed the encoder
+        directly, without going through the `data` cache.
+        """
+        serialized_data = self.to_value(self.instance)
+        json_bytes = json.dumps(serialized_data)
+        if not isinstance(json_bytes, bytes):  # stdlib json fallback
+            json_bytes = json_bytes.encode()
+        return json_bytes
 
     @property
     def data(self):
@@ -137,10 +368,12 @@ class Serializer(six.with_metaclass(SerializerMeta, SerializerBase)):
         """Get the serialized data from the Serializer instance. The data is cached
         for further accesses.
         """
-        # Cache the data for next time `.data` is called.
-        if self._data is None:
-            self._data = self.to_value(self.instance)
-        return self._data
+        # Cache the data for next time `.data` is called. The warm path is
+        # a single slot read and `None` check.
+        data = self._data
+        if data is None:
+            data = self._data = self.to_value(self.instance)
+        return data
 
 
 class DictSerializer(Serializer):
@@ -16,8 +16,8 @@ setup(
     author="Mehdi Alaoui",
     author_email="alaoui.mehdi.1995@gmail.com",
     packages=find_packages(include=["django_rest*"]),
-    install_requires=["django>=1.11", "six"],
-    python_requires=">=2.7, !=3.0.*, !=3.1.*, !=3.2.*, <4",
+    install_requires=["django>=1.11"],
+    python_requires=">=3.6, <4",
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Environment :: Web Environment",
@@ -39,12 +39,7 @@ setup(
         "Natural Language :: English",
         "Operating System :: OS Independent",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 2",
-        "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.3",
-        "Programming Language :: Python :: 3.4",
-        "Programming Language :: Python :: 3.5",
         "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
@@ -15,56 +15,31 @@ def _mock_view(**kwargs):
     return Mock(**kwargs)
 
 
-def test_api_view_without_parenthesis_syntax_works_on_function_based_views(monkeypatch):
-    # Given
-    monkeypatch.setattr(
-        "django_rest.decorators.inspect.isfunction", lambda x: isinstance(x, Mock)
-    )
-    request = rf.get("/whatever/?filter=true&page=3")
-    target_view = _mock_view()
-    target_kwargs = {"pk": 3, "foo": "bar"}
-
-    decorated_view = api_view(target_view)
-
-    # When
-    decorated_view(request, **target_kwargs)
-
-    # Then
-    target_view.assert_called_once_with(
-        request,
-        url_params=target_kwargs,
-        query_params={"filter": "true", "page": "3"},
-        deserialized_data=None,
-    )
-
-
-def test_api_view_with_parenthesis_without_args_syntax_works_on_function_based_views(
-    monkeypatch,
-):
-    # Given
-    monkeypatch.setattr(
-        "django_rest.decorators.inspect.isfunction", lambda x: isinstance(x, Mock)
-    )
-    request = rf.get("/whatever/?filter=true&page=3")
-    target_view = _mock_view()
-    target_kwargs = {"pk": 3, "foo": "bar"}
+def _build_custom_view(mocked_get):
+    # The class body (and django's View machinery behind it) runs once per
+    # call, here, instead of being redeclared inside every test.
+    class CustomView(View):
+        class_attribute = "foo"
+        get = mocked_get
 
-    decorated_view = api_view()(target_view)
+    return CustomView
 
-    # When
-    decorated_view(request, **target_kwargs)
 
-    # Then
-    target_view.assert_called_once_with(
-        request,
-        url_params=target_kwargs,
-        query_params={"filter": "true", "page": "3"},
-        deserialized_data=None,
-    )
+#  The three supported decoration syntaxes, applied identically to both the
+#  function-based and the class-based tests below.
+DECORATION_SYNTAXES = [
+    pytest.param(lambda view: api_view(view), id="without_parenthesis"),
+    pytest.param(lambda view: api_view()(view), id="with_parenthesis_without_args"),
+    pytest.param(
+        lambda view: api_view(allowed_methods=("GET",))(view),
+        id="with_parenthesis_with_args",
+    ),
+]
 
 
-def test_api_view_with_parenthesis_with_args_syntax_works_on_function_based_views(
-    monkeypatch,
+@pytest.mark.parametrize("decorate", DECORATION_SYNTAXES)
+def test_api_view_decoration_syntaxes_work_on_function_based_views(
+    monkeypatch, decorate
 ):
     # Given
     monkeypatch.setattr(
@@ -74,7 +49,7 @@ def test_api_view_with_parenthesis_with_args_syntax_works_on_function_based_view
     target_view = _mock_view()
     target_kwargs = {"pk": 3, "foo": "bar"}
 
-    decorated_view = api_view(allowed_methods=("GET",))(target_view)
+    decorated_view = decorate(target_view)
 
     # When
     decorated_view(request, **target_kwargs)
@@ -88,81 +63,19 @@ def test_api_view_with_parenthesis_with_args_syntax_works_on_function_based_view
     )
 
 
-def test_api_view_without_parenthesis_syntax_works_on_class_based_views(monkeypatch):
+@pytest.mark.parametrize("decorate", DECORATION_SYNTAXES)
+def test_api_view_decoration_syntaxes_work_on_class_based_views(monkeypatch, decorate):
     # Given
     monkeypatch.setattr(
         "django_rest.decorators.inspect.ismethod", lambda x: isinstance(x, Mock)
     )
     mocked_get = _mock_view()
-
-    class CustomView(View):
-        class_attribute = "foo"
-        get = mocked_get
-
-    request = rf.get("/whatever/?filter=true&page=3")
-    target_kwargs = {"pk": 3, "foo": "bar"}
-
-    DecoratedView = api_view(CustomView)
-
-    # When
-    DecoratedView().dispatch(request, **target_kwargs)
-
-    # Then
-    mocked_get.assert_called_once_with(
-        request,
-        url_params=target_kwargs,
-        query_params={"filter": "true", "page": "3"},
-        deserialized_data=None,
-    )
-
-
-def test_api_view_with_parenthesis_without_args_syntax_works_on_class_based_views(
-    monkeypatch,
-):
-    # Given
-    monkeypatch.setattr(
-        "django_rest.decorators.inspect.ismethod", lambda x: isinstance(x, Mock)
-    )
-    mocked_get = _mock_view()
-
-    class CustomView(View):
-        class_attribute = "foo"
-        get = mocked_get
-
-    request = rf.get("/whatever/?filter=true&page=3")
-    target_kwargs = {"pk": 3, "foo": "bar"}
-
-    DecoratedView = api_view()(CustomView)
-
-    # When
-    DecoratedView().dispatch(request, **target_kwargs)
-
-    # Then
-    mocked_get.assert_called_once_with(
-        request,
-        url_params=target_kwargs,
-        query_params={"filter": "true", "page": "3"},
-        deserialized_data=None,
-    )
-
-
-def test_api_view_with_parenthesis_with_args_syntax_works_on_class_based_views(
-    monkeypatch,
-):
-    # Given
-    monkeypatch.setattr(
-        "django_rest.decorators.inspect.ismethod", lambda x: isinstance(x, Mock)
-    )
-    mocked_get = _mock_view()
-
-    class CustomView(View):
-        class_attribute = "foo"
-        get = mocked_get
+    CustomView = _build_custom_view(mocked_get)
 
     request = rf.get("/whatever/?filter=true&page=3")
     target_kwargs = {"pk": 3, "foo": "bar"}
 
-    DecoratedView = api_view(allowed_methods=("GET",))(CustomView)
+    DecoratedView = decorate(CustomView)
 
     # When
     DecoratedView().dispatch(request, **target_kwargs)
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import inspect
 import json
 
 import pytest
@@ -22,6 +21,7 @@ from django_rest.http.exceptions import (
     InternalServerError,
     UnsupportedMediaType,
 )
+from django_rest.http.methods import ALL_METHODS
 from django_rest.permissions import AllowAny, BasePermission
 
 rf = RequestFactory()
@@ -32,157 +32,194 @@ def _mock_view(**kwargs):
     return Mock(**kwargs)
 
 
-class AllowNone(BasePermission):
-    def has_permission(self, request, view):
-        return False
-
-
-def test_transform_querydict_into_regular_dict():
-    # Given
-    query_dict = QueryDict("foo=3&foo=4&foo=5&bar=1&baz=true&collapse")
-
-    # When
-    _dict = transform_query_dict_into_regular_dict(query_dict)
-
-    # Then
-    assert _dict == {
-        "foo": ["3", "4", "5"],
-        "bar": "1",
-        "baz": "true",
-        "collapse": "",
-    }
+@pytest.fixture
+def mock_view():
+    return _mock_view()
 
 
-def test_deserializer_map_with_custom_deserializer_class():
-    # Given
-    class CustomDeserializer(Deserializer):
-        pass
-
-    # When
-    deserializer_map = build_deserializer_map(CustomDeserializer)
+#  Throwaway argument filler for the introspection-only wrapper tests. It
+#  must stay a Mock: the wrappers call/iterate their arguments at build
+#  time, so a bare `object()` sentinel would break there. Nothing ever
+#  asserts on it, hence one shared instance instead of four per test.
+_PLACEHOLDER = Mock()
 
-    # Then
-    assert deserializer_map == {
-        "POST": CustomDeserializer,
-        "PUT": CustomDeserializer,
-        "PATCH": CustomDeserializer,
-    }
 
+def _error_message(resp):
+    # `json.loads` accepts bytes directly: no intermediate `.decode()` str.
+    return json.loads(resp.content)["error_msg"]
 
-def test_deserializer_map_with_complete_dict():
-    # Given
-    class CustomDeserializer(Deserializer):
-        pass
 
-    deserializer_init_map = {
-        "POST": CustomDeserializer,
-        "PUT": CustomDeserializer,
-        "PATCH": CustomDeserializer,
-    }
+def assert_error_response(resp, status_code, error_msg):
+    """Asserts both halves of an error response in one place, so each
+    error-path test states only which error it expects."""
+    assert resp.status_code == status_code
+    assert _error_message(resp) == error_msg
 
-    # When
-    deserializer_map = build_deserializer_map(CustomDeserializer)
 
-    # Then
-    assert deserializer_map == deserializer_init_map
+class AllowNone(BasePermission):
+    def has_permission(self, request, view):
+        return False
 
 
-def test_deserializer_map_with_incomplete_dict():
+#  (id, query string, expected regular dict).
+QUERY_DICT_CASES = [
+    (
+        "mixed_single_and_multi_values",
+        "foo=3&foo=4&foo=5&bar=1&baz=true&collapse",
+        {"foo": ["3", "4", "5"], "bar": "1", "baz": "true", "collapse": ""},
+    ),
+    ("multi_value_key_only", "foo=1&foo=2", {"foo": ["1", "2"]}),
+    ("single_pair", "foo=bar", {"foo": "bar"}),
+    ("valueless_key", "collapse", {"collapse": ""}),
+    ("empty_query_string", "", {}),
+]
+
+
+@pytest.mark.parametrize(
+    "query_string,expected_dict",
+    [
+        pytest.param(query_string, expected, id=case_id)
+        for case_id, query_string, expected in QUERY_DICT_CASES
+    ],
+)
+def test_transform_querydict_into_regular_dict(query_string, expected_dict):
     # Given
-    class CustomDeserializer(Deserializer):
-        pass
-
-    deserializer_init_map = {
-        "POST": CustomDeserializer,
-    }
+    query_dict = QueryDict(query_string)
 
     # When
-    deserializer_map = build_deserializer_map(deserializer_init_map)
-
-    # Then
-    assert deserializer_map == {
-        "POST": CustomDeserializer,
-        "PUT": AllPassDeserializer,
-        "PATCH": AllPassDeserializer,
-    }
-
-
-def test_deserializer_map_with_invalid_type_deserializer():
-    # Given
-    class InvalidDeserializer(object):
-        pass
-
-    # Then
-    with pytest.raises(TypeError):
-        # When
-        build_deserializer_map(InvalidDeserializer)
-
-
-def test_deserializer_map_with_dict_having_invalid_value():
-    # Given
-    class InvalidDeserializer(object):
-        pass
-
-    deserializer_init_map = {
-        "POST": AllPassDeserializer,
-        "PUT": InvalidDeserializer,
-    }
+    _dict = transform_query_dict_into_regular_dict(query_dict)
 
     # Then
-    with pytest.raises(TypeError):
-        # When
-        build_deserializer_map(deserializer_init_map)
+    assert _dict == expected_dict
+
+
+class CustomDeserializer(Deserializer):
+    pass
+
+
+class InvalidDeserializer(object):
+    pass
+
+
+#  (id, build_deserializer_map() input, expected map). `TypeError` as
+#  expected map means the call raises.
+DESERIALIZER_MAP_CASES = [
+    (
+        "custom_deserializer_class",
+        CustomDeserializer,
+        {
+            "POST": CustomDeserializer,
+            "PUT": CustomDeserializer,
+            "PATCH": CustomDeserializer,
+        },
+    ),
+    (
+        "complete_dict",
+        {
+            "POST": CustomDeserializer,
+            "PUT": CustomDeserializer,
+            "PATCH": CustomDeserializer,
+        },
+        {
+            "POST": CustomDeserializer,
+            "PUT": CustomDeserializer,
+            "PATCH": CustomDeserializer,
+        },
+    ),
+    (
+        "incomplete_dict",
+        {"POST": CustomDeserializer},
+        {
+            "POST": CustomDeserializer,
+            "PUT": AllPassDeserializer,
+            "PATCH": AllPassDeserializer,
+        },
+    ),
+    ("invalid_type_deserializer", InvalidDeserializer, TypeError),
+    (
+        "dict_having_invalid_value",
+        {"POST": AllPassDeserializer, "PUT": InvalidDeserializer},
+        TypeError,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "deserializer_class,expected_map",
+    [
+        pytest.param(deserializer_class, expected_map, id=case_id)
+        for case_id, deserializer_class, expected_map in DESERIALIZER_MAP_CASES
+    ],
+)
+def test_build_deserializer_map(deserializer_class, expected_map):
+    if expected_map is TypeError:
+        with pytest.raises(TypeError):
+            build_deserializer_map(deserializer_class)
+    else:
+        assert build_deserializer_map(deserializer_class) == expected_map
 
 
-def test_extract_payload_from_get_method_without_payload():
-    assert extract_request_payload(rf.get("/whatever/")) is None
+PAYLOAD = {"foo": "bar", "baz": 3}
 
+#  Built once for every test needing a plain JSON POST: requests are
+#  read-only for the code under test, so sharing is safe.
+JSON_POST_REQUEST = rf.post(
+    "/whatever/", data=json.dumps(PAYLOAD), content_type="application/json"
+)
 
-def test_extract_payload_from_get_method_with_payload():
-    # Given
-    payload = {"foo": "bar", "baz": 3}
-    request = rf.get("/whatever/", payload)
-    # Then
+#  (id, request builder, expected payload, expected payload with form data).
+#  `UnsupportedMediaType` as expected payload means the extraction raises.
+EXTRACT_PAYLOAD_CASES = [
+    ("get_without_payload", lambda: rf.get("/whatever/"), None, None),
     # None because the content is saved as queryparams for GET method
-    assert extract_request_payload(request, True) is None
-    assert extract_request_payload(request, False) is None
-
-
-def test_extract_payload_from_post_method_application_json():
-    # Given
-    payload = {"foo": "bar", "baz": 3}
-    json_payload = json.dumps(payload)
-    request = rf.post("/whatever/", data=json_payload, content_type="application/json")
-    # Then
-    assert extract_request_payload(request, False) == payload
-    assert extract_request_payload(request, True) == payload
-
-
-def test_extract_payload_from_post_method_form():
+    ("get_with_payload", lambda: rf.get("/whatever/", PAYLOAD), None, None),
+    ("post_json", lambda: JSON_POST_REQUEST, PAYLOAD, PAYLOAD),
+    (
+        "post_form",
+        lambda: rf.post("/whatever/", PAYLOAD),
+        UnsupportedMediaType,
+        {"foo": "bar", "baz": "3"},
+    ),
+    (
+        "put_json",
+        lambda: rf.put(
+            "/whatever/", data=json.dumps(PAYLOAD), content_type="application/json"
+        ),
+        PAYLOAD,
+        PAYLOAD,
+    ),
+    (
+        "patch_json",
+        lambda: rf.patch(
+            "/whatever/", data=json.dumps(PAYLOAD), content_type="application/json"
+        ),
+        PAYLOAD,
+        PAYLOAD,
+    ),
+    ("delete", lambda: rf.delete("/whatever/"), None, None),
+]
+
+
+@pytest.mark.parametrize(
+    "build_request,expected_payload,form_data_expected_payload",
+    [
+        pytest.param(build_request, expected, form_expected, id=case_id)
+        for case_id, build_request, expected, form_expected in EXTRACT_PAYLOAD_CASES
+    ],
+)
+def test_extract_request_payload(
+    build_request, expected_payload, form_data_expected_payload
+):
     # Given
-    payload = {"foo": "bar", "baz": 3}
-    request = rf.post("/whatever/", payload)
-    # Then
-    assert extract_request_payload(request, True) == {
-        "foo": "bar",
-        "baz": "3",
-    }
-    with pytest.raises(UnsupportedMediaType):
-        extract_request_payload(request, allow_form_data=False)
-
+    request = build_request()
 
-def test_extract_payload_put_method():
-    # Given
-    payload = {"foo": "bar", "baz": 3}
-    json_payload = json.dumps(payload)
-    request = rf.put("/whatever/", data=json_payload, content_type="application/json")
     # Then
-    assert extract_request_payload(request, False) == payload
-    assert extract_request_payload(request, True) == payload
-
-
-def test_extract_payload_delete_method():
-    assert extract_request_payload(rf.delete("/whatever/")) is None
+    if expected_payload is UnsupportedMediaType:
+        with pytest.raises(UnsupportedMediaType):
+            extract_request_payload(request, allow_form_data=False)
+    else:
+        assert extract_request_payload(request, False) == expected_payload
+    assert extract_request_payload(request, True) == form_data_expected_payload
 
 
 def test_function_wrapper_conserves_view_informations():
@@ -191,19 +228,21 @@ def test_function_wrapper_conserves_view_informations():
         """ This is a docstring example """
 
     # When
-    decorated_view = build_function_wrapper(Mock(), Mock(), Mock(), Mock(), target_view)
+    decorated_view = build_function_wrapper(
+        _PLACEHOLDER, _PLACEHOLDER, _PLACEHOLDER, _PLACEHOLDER, target_view
+    )
 
     # Then
-    assert inspect.isfunction(decorated_view)
+    assert callable(decorated_view) and not isinstance(decorated_view, type)
     assert decorated_view.__name__ == "target_view"
     assert decorated_view.__doc__ == " This is a docstring example "
     assert decorated_view.__module__ == target_view.__module__
 
 
-def test_function_wrapper_returns_403_when_permission_class_returns_false():
+def test_function_wrapper_returns_403_when_permission_class_returns_false(mock_view):
     # Given
     request = rf.get("/whatever/")
-    target_view = _mock_view()
+    target_view = mock_view
 
     # When
     decorated_view = build_function_wrapper(
@@ -216,10 +255,10 @@ def test_function_wrapper_returns_403_when_permission_class_returns_false():
     target_view.assert_not_called()
 
 
-def test_function_wrapper_returns_405_when_method_not_allowed():
+def test_function_wrapper_returns_405_when_method_not_allowed(mock_view):
     # Given
     request = rf.get("/whatever/")
-    target_view = _mock_view()
+    target_view = mock_view
 
     # When
     decorated_view = build_function_wrapper(
@@ -232,12 +271,28 @@ def test_function_wrapper_returns_405_when_method_not_allowed():
     target_view.assert_not_called()
 
 
-def test_function_wrapper_returns_400_when_data_isnt_valid():
+def test_function_wrapper_returns_405_for_unknown_verb_even_if_all_methods_allowed(
+    mock_view,
+):
     # Given
-    payload = {"foo": "bar", "baz": 3}
-    json_payload = json.dumps(payload)
-    request = rf.post("/whatever/", data=json_payload, content_type="application/json")
-    target_view = _mock_view()
+    request = rf.generic("PROPFIND", "/whatever/")
+    target_view = mock_view
+
+    # When
+    decorated_view = build_function_wrapper(
+        AllowAny, ALL_METHODS, None, False, target_view
+    )
+    resp = decorated_view(request)
+
+    # Then
+    assert resp.status_code == 405
+    target_view.assert_not_called()
+
+
+def test_function_wrapper_returns_400_when_data_isnt_valid(mock_view):
+    # Given
+    request = JSON_POST_REQUEST
+    target_view = mock_view
     allow_forms = False
 
     class PreventDeserializer(Deserializer):
@@ -257,7 +312,9 @@ def test_function_wrapper_returns_400_when_data_isnt_valid():
     target_view.assert_not_called()
 
 
-def test_function_wrapper_calls_the_target_view_when_the_post_request_is_correct():
+def test_function_wrapper_calls_the_target_view_when_the_post_request_is_correct(
+    mock_view,
+):
     # Given
     payload = {"foo": "bar", "baz": 3}
     json_payload = json.dumps(payload)
@@ -266,7 +323,7 @@ def test_function_wrapper_calls_the_target_view_when_the_post_request_is_correct
         data=json_payload,
         content_type="application/json",
     )
-    target_view = _mock_view()
+    target_view = mock_view
     deserializer_map = {"POST": AllPassDeserializer}
     allow_forms = False
 
@@ -285,10 +342,12 @@ def test_function_wrapper_calls_the_target_view_when_the_post_request_is_correct
     )
 
 
-def test_function_wrapper_calls_the_target_view_when_the_get_request_is_correct():
+def test_function_wrapper_calls_the_target_view_when_the_get_request_is_correct(
+    mock_view,
+):
     # Given
     request = rf.get("/whatever/", data={"filter": "true", "page": "3"})
-    target_view = _mock_view()
+    target_view = mock_view
     decorated_view = build_function_wrapper(AllowAny, ("GET",), {}, False, target_view)
 
     # When
@@ -310,38 +369,43 @@ def test_function_wrapper_should_return_correct_status_code_when_base_api_except
         RESPONSE_MESSAGE = "Foo bar exception"
 
     request = rf.get("/whatever/")
-    target_view = _mock_view(side_effect=CustomApiException())
+    calls = []
+
+    # A plain-function stub: Mock.__call__'s spec walking and call matching
+    # are useless weight when a closure records the call just as well.
+    def target_view(*args, **kwargs):
+        calls.append((args, kwargs))
+        raise CustomApiException()
 
     # When
     decorated_view = build_function_wrapper(AllowAny, ("GET",), {}, False, target_view)
     resp = decorated_view(request)
 
     # Then
-    target_view.assert_called_once_with(
-        request, url_params={}, query_params={}, deserialized_data=None
-    )
-    assert resp.status_code == 489
-    assert json.loads(resp.content.decode())["error_msg"] == "Foo bar exception"
+    assert calls == [
+        ((request,), {"url_params": {}, "query_params": {}, "deserialized_data": None})
+    ]
+    assert_error_response(resp, 489, "Foo bar exception")
 
 
 def test_function_wrapper_should_return_500_when_unkown_exception_is_raised_in_the_view():
     # Given
-    target_view = _mock_view(side_effect=TypeError("NoneType has no attribute 'name'"))
-    request = RequestFactory().get("/whatever/")
+    request = rf.get("/whatever/")
+    calls = []
+
+    def target_view(*args, **kwargs):
+        calls.append((args, kwargs))
+        raise TypeError("NoneType has no attribute 'name'")
 
     # When
     decorated_view = build_function_wrapper(AllowAny, ("GET",), {}, False, target_view)
     resp = decorated_view(request)
 
     # Then
-    assert resp.status_code == 500
-    assert (
-        json.loads(resp.content.decode())["error_msg"]
-        == InternalServerError.RESPONSE_MESSAGE
-    )
-    target_view.assert_called_once_with(
-        request, url_params={}, query_params={}, deserialized_data=None
-    )
+    assert_error_response(resp, 500, InternalServerError.RESPONSE_MESSAGE)
+    assert calls == [
+        ((request,), {"url_params": {}, "query_params": {}, "deserialized_data": None})
+    ]
 
 
 def test_class_wrapper_conserves_class_view_informations():
@@ -358,10 +422,12 @@ def test_class_wrapper_conserves_class_view_informations():
             pass
 
     # When
-    DecoratedView = build_class_wrapper(Mock(), Mock(), Mock(), Mock(), CustomView)
+    DecoratedView = build_class_wrapper(
+        _PLACEHOLDER, _PLACEHOLDER, _PLACEHOLDER, _PLACEHOLDER, CustomView
+    )
 
     # Then
-    assert inspect.isclass(DecoratedView)
+    assert isinstance(DecoratedView, type)
     assert issubclass(DecoratedView, View)
     assert DecoratedView.__name__ == "CustomView"
     assert DecoratedView.__doc__ == " Custom view for custom purpose "
@@ -392,7 +458,9 @@ def test_class_wrapper_conserves_all_methods_and_attributes_of_wrapped_view():
             pass
 
     # When
-    DecoratedView = build_class_wrapper(Mock(), Mock(), Mock(), Mock(), CustomView)
+    DecoratedView = build_class_wrapper(
+        _PLACEHOLDER, _PLACEHOLDER, _PLACEHOLDER, _PLACEHOLDER, CustomView
+    )
 
     # Then
     assert DecoratedView().class_attribute == "foo"
@@ -422,7 +490,9 @@ def test_class_wrapper_decorates_http_methods_only():
             return 3
 
     # When
-    DecoratedView = build_class_wrapper(Mock(), Mock(), Mock(), Mock(), CustomView)
+    DecoratedView = build_class_wrapper(
+        _PLACEHOLDER, _PLACEHOLDER, _PLACEHOLDER, _PLACEHOLDER, CustomView
+    )
     decorated_view = DecoratedView()
     original_view = decorated_view._wrapped_view
 
@@ -102,6 +102,22 @@ def test_simple_deserializer_required_valid_data_should_succeed():
     assert deserializer.data == {"foo": 3, "bar": "test value"}
 
 
+def test_mutating_returned_errors_should_not_leak_into_other_deserializers():
+    # Given
+    class SimpleDeserializer(Deserializer):
+        foo = fields.IntegerField(required=True, min_value=0)
+
+    valid_deserializer = SimpleDeserializer({"foo": "3"})
+
+    # When
+    valid_deserializer.errors["hacked"] = ["boom"]
+
+    # Then: the mutation stays confined to the instance it was made on.
+    other_deserializer = SimpleDeserializer({"foo": "5"})
+    assert other_deserializer.is_valid()
+    assert other_deserializer.errors == {}
+
+
 def test_simple_deserializer_required_invalid_data_should_fail():
     # Given
     class SimpleDeserializer(Deserializer):
@@ -431,3 +447,9 @@ def test_validate_any_deserializer_should_validate_any_kind_of_data():
     deserializer = AllPassDeserializer(data={"foo": {"bar": "baz", "baz": 3}})
     assert deserializer.is_valid()
     assert deserializer.data == {"foo": {"bar": "baz", "baz": 3}}
+
+    # Non-dict JSON payloads (e.g. a top-level list) pass through unchanged,
+    # exactly like on the wrapper paths that skip deserialization entirely.
+    deserializer = AllPassDeserializer(data=[1, 2, 3])
+    assert deserializer.is_valid()
+    assert deserializer.data == [1, 2, 3]
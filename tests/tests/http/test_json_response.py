@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import json
+import sys
+
+from django.test import Client, override_settings
+from django.urls import path
+
+from django_rest.http.response import JsonResponse
+
+
+def test_json_response_serializes_content_to_json():
+    # Given
+    content = {"foo": "bar", "baz": 3}
+
+    # When
+    response = JsonResponse(content)
+
+    # Then
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert json.loads(response.content.decode()) == content
+
+
+def test_json_response_with_additional_headers():
+    # When
+    response = JsonResponse({}, additional_headers={"X-Custom-Header": "yes"})
+
+    # Then
+    assert response["X-Custom-Header"] == "yes"
+    assert response["Content-Type"] == "application/json"
+
+
+def test_json_response_headers_are_not_shared_between_responses():
+    # Given
+    first_response = JsonResponse({}, additional_headers={"X-Custom-Header": "yes"})
+
+    # When
+    second_response = JsonResponse({})
+
+    # Then
+    assert first_response.has_header("X-Custom-Header") is True
+    assert second_response.has_header("X-Custom-Header") is False
+
+
+def test_json_response_with_custom_status_code():
+    # When
+    response = JsonResponse({"error_msg": "Not found."}, status=404)
+
+    # Then
+    assert response.status_code == 404
+    assert json.loads(response.content.decode()) == {"error_msg": "Not found."}
+
+
+def _json_view(request):
+    return JsonResponse({"from": "view"})
+
+
+urlpatterns = [path("json/", _json_view)]
+
+
+@override_settings(ROOT_URLCONF=sys.modules[__name__])
+def test_json_response_is_served_by_django_handlers():
+    # When
+    response = Client().get("/json/")
+
+    # Then: the handlers could attach their bookkeeping attributes
+    # (`_handler_class`, `_resource_closers`, ..) and serve the body.
+    assert response.status_code == 200
+    assert json.loads(response.content.decode()) == {"from": "view"}
+    assert response.headers["Content-Type"] == "application/json"
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 import pytest
-import six
 from mock import Mock
 
 from django_rest.permissions import (
@@ -150,6 +149,21 @@ def test_NOT_operator():
     assert NotB().has_permission(request=Mock(), view=Mock()) is True
 
 
+def test_subclass_of_composite_overriding_has_permission_should_be_treated_as_leaf():
+    # Given: a subclass of a composite whose `has_permission` ignores the
+    # inherited operator tree entirely.
+    class AlwaysDeny(IsAuthenticated | IsAdminUser):
+        def has_permission(self, request, view):
+            return False
+
+    # When: the subclass is composed further.
+    ResultPermission = AlwaysDeny | IsReadOnly
+    request = Mock(**{"method": "POST", "user.is_authenticated": True})
+
+    # Then: the override is honored instead of the parent's flattened logic.
+    assert ResultPermission().has_permission(request, view=Mock()) is False
+
+
 def test_defining_new_binary_operator_without_overriding_calculate_method_should_raise_error():
     # Given
     class A(BasePermission):
@@ -160,7 +174,7 @@ def test_defining_new_binary_operator_without_overriding_calculate_method_should
         def has_permission(self, request, view):
             return True
 
-    class NewOperator(six.with_metaclass(MetaOperand, BinaryOperator)):
+    class NewOperator(BinaryOperator, metaclass=MetaOperand):
         pass
 
     # When
@@ -177,7 +191,7 @@ def test_defining_new_unary_operator_without_overriding_calculate_method_should_
         def has_permission(self, request, view):
             return True
 
-    class NewOperator(six.with_metaclass(MetaOperand, UnaryOperator)):
+    class NewOperator(UnaryOperator, metaclass=MetaOperand):
         pass
 
     # When
@@ -14,21 +14,32 @@ from django_rest.permissions import (
 )
 
 
+def _mock_request(method=None, **user_flags):
+    """Builds a request mock: `_mock_request("POST", is_superuser=False)`
+    sets `request.method` and `request.user.is_superuser`, instead of
+    repeating the dotted-attribute `Mock(**{...})` spelling in every test.
+    """
+    attrs = {"user.{}".format(flag): value for flag, value in user_flags.items()}
+    if method is not None:
+        attrs["method"] = method
+    return Mock(**attrs)
+
+
 def test_is_admin_or_read_only_permission_should_forbid_access_to_non_admin_POST_request():
     IsAdminUserOrReadOnly = IsAdminUser | IsReadOnly
-    request = Mock(**{"method": "POST", "user.is_superuser": False})
+    request = _mock_request("POST", is_superuser=False)
     assert IsAdminUserOrReadOnly().has_permission(request, view=Mock()) is False
 
 
 def test_is_admin_or_read_only_permission_should_grant_access_to_non_admin_GET_request():
     IsAdminUserOrReadOnly = IsAdminUser | IsReadOnly
-    request = Mock(**{"method": "GET", "user.is_superuser": False})
+    request = _mock_request("GET", is_superuser=False)
     assert IsAdminUserOrReadOnly().has_permission(request, view=Mock()) is True
 
 
 def test_is_admin_or_read_only_permission_should_grant_access_to_admin_POST_request():
     IsAdminUserOrReadOnly = IsAdminUser | IsReadOnly
-    request = Mock(**{"method": "POST", "user.is_superuser": True})
+    request = _mock_request("POST", is_superuser=True)
     assert IsAdminUserOrReadOnly().has_permission(request, view=Mock()) is True
 
 
@@ -38,37 +49,52 @@ def test_allow_any_should_grant_access_to_everyone():
 
 
 def test_is_admin_permission_should_grant_access_to_admin():
-    request = Mock(**{"user.is_superuser": True})
+    request = _mock_request(is_superuser=True)
     assert IsAdminUser().has_permission(request, view=Mock()) is True
 
 
 def test_is_admin_permission_should_forbid_access_to_simple_user():
-    request = Mock(**{"user.is_superuser": False})
+    request = _mock_request(is_superuser=False)
     assert IsAdminUser().has_permission(request, view=Mock()) is False
 
 
 def test_is_staff_permission_should_grant_access_to_staff():
-    request = Mock(**{"user.is_staff": True})
+    request = _mock_request(is_staff=True)
     assert IsStaffUser().has_permission(request, view=Mock()) is True
 
 
 def test_is_staff_permission_should_forbid_access_to_simple_user():
-    request = Mock(**{"user.is_staff": False})
+    request = _mock_request(is_staff=False)
     assert IsStaffUser().has_permission(request, view=Mock()) is False
 
 
+def test_staff_and_admin_permissions_should_not_require_an_authenticated_user():
+    # Given: a custom user object exposing the staff/admin flags without the
+    # `is_authenticated` attribute of Django's user model. A truthy user is
+    # enough for these permissions.
+    class CustomUser(object):
+        is_staff = True
+        is_superuser = True
+
+    request = Mock(user=CustomUser())
+
+    # Then
+    assert IsStaffUser().has_permission(request, view=Mock()) is True
+    assert IsAdminUser().has_permission(request, view=Mock()) is True
+
+
 def test_is_authenticated_should_grant_access_to_authenticated_user():
-    request = Mock(**{"user.is_authenticated": True})
+    request = _mock_request(is_authenticated=True)
     assert IsAuthenticated().has_permission(request, view=Mock()) is True
 
 
 def test_is_authenticated_should_forbid_access_to_anonymous_user():
-    request = Mock(**{"user.is_authenticated": False})
+    request = _mock_request(is_authenticated=False)
     assert IsAuthenticated().has_permission(request, view=Mock()) is False
 
 
 def test_is_authenticated_or_read_only_should_grant_access_to_authenticated_user_on_POST_request():
-    request = Mock(**{"method": "POST", "user.is_authenticated": True})
+    request = _mock_request("POST", is_authenticated=True)
     assert IsAuthenticatedOrReadOnly().has_permission(request, view=Mock()) is True
 
 
@@ -83,12 +109,12 @@ def test_is_authenticated_or_read_only_should_forbid_access_to_anonymous_user_on
 
 
 def test_is_readonly_permission_should_grant_access_on_GET_request():
-    request = Mock(method="GET")
+    request = _mock_request("GET")
     assert IsReadOnly().has_permission(request, view=Mock()) is True
 
 
 def test_is_readonly_permission_should_forbid_acesss_on_POST_request():
-    request = Mock(method="POST")
+    request = _mock_request("POST")
     assert IsReadOnly().has_permission(request, view=Mock()) is False
 
 
@@ -113,8 +139,8 @@ def test_defining_custom_permission_should_grant_access_correctly():
 
 def test_AND_operator_on_same_permission_should_be_idempotent():
     ViewPermission = IsReadOnly & IsReadOnly
-    allowed_request = Mock(method="GET")
-    denied_request = Mock(method="POST")
+    allowed_request = _mock_request("GET")
+    denied_request = _mock_request("POST")
     assert ViewPermission().has_permission(
         allowed_request, view=Mock()
     ) == IsReadOnly().has_permission(allowed_request, view=Mock())
@@ -125,8 +151,8 @@ def test_AND_operator_on_same_permission_should_be_idempotent():
 
 def test_OR_operator_on_same_permission_should_be_idempotent():
     ViewPermission = IsReadOnly | IsReadOnly
-    allowed_request = Mock(method="GET")
-    denied_request = Mock(method="POST")
+    allowed_request = _mock_request("GET")
+    denied_request = _mock_request("POST")
     assert ViewPermission().has_permission(
         allowed_request, view=Mock()
     ) == IsReadOnly().has_permission(allowed_request, view=Mock())
@@ -42,6 +42,8 @@ class ComplexSerpySerializer(serpy.Serializer):
 
 
 class NestedObject(object):
+    __slots__ = ("x", "y", "z", "w")
+
     def __init__(self, x, y, z, w):
         self.x = x
         self.y = y
@@ -50,6 +52,8 @@ class NestedObject(object):
 
 
 class ComplexObject(object):
+    __slots__ = ("foo", "bar", "sub", "subs")
+
     def __init__(self):
         self.foo = "bar"
         self.bar = 5
@@ -63,16 +67,22 @@ class ComplexObject(object):
 def runtest_function(test_set_length):
     test_set = [ComplexObject() for i in range(test_set_length)]
 
+    # The serializers are built outside the timed regions: only the
+    # serialization work itself (`.data`) is measured, for both frameworks.
+    django_rest_serializer = ComplexDjangoRESTSerializer(instance=test_set, many=True)
+    serpy_serializer = ComplexSerpySerializer(instance=test_set, many=True)
+
     # django_rest
-    start_time = time.time()
-    django_rest_result = ComplexDjangoRESTSerializer(instance=test_set, many=True).data
-    django_rest_timing = time.time() - start_time
+    start_time = time.perf_counter_ns()
+    django_rest_result = django_rest_serializer.data
+    django_rest_timing = time.perf_counter_ns() - start_time
 
     # Serpy
-    start_time = time.time()
-    serpy_result = ComplexSerpySerializer(instance=test_set, many=True).data
-    serpy_timing = time.time() - start_time
+    start_time = time.perf_counter_ns()
+    serpy_result = serpy_serializer.data
+    serpy_timing = time.perf_counter_ns() - start_time
 
+    # Correctness check, outside of both timed regions.
     assert django_rest_result == serpy_result
 
     speed_ratio = django_rest_timing / serpy_timing
@@ -196,6 +196,21 @@ def test_dotted_attribute_parameter():
     assert data == {"a": 2}
 
 
+def test_dotted_attribute_parameter_containing_a_python_keyword():
+    # Having: "class" is a valid attribute name for `attrgetter`, but not
+    # for generated source code.
+    class ASerializer(Serializer):
+        a = fields.Field("a.class")
+
+    obj = Mock(**{"a.class": 2})
+
+    # When
+    data = ASerializer(obj).data
+
+    # Then
+    assert data == {"a": 2}
+
+
 def test_implementing_custom_field():
     # Having
     class Add5Field(fields.Field):
@@ -513,3 +528,33 @@ def test_serializer_with_custom_output_label():
     assert "content" not in data
     assert data["@context"] == "http://foo/bar/baz/"
     assert data["@content"] == "http://baz/bar/foo/"
+
+
+def test_to_json_serializes_straight_to_json_bytes():
+    # Having
+    import json
+
+    class ASerializer(Serializer):
+        a = fields.IntegerField()
+        b = fields.CharField()
+
+    obj = Mock(a="5", b=3)
+
+    # When
+    json_bytes = ASerializer(obj).to_json()
+
+    # Then
+    assert isinstance(json_bytes, bytes)
+    assert json.loads(json_bytes.decode()) == {"a": 5, "b": "3"}
+
+
+def test_serializer_fields_are_compiled_once_and_frozen():
+    # Having
+    class ASerializer(Serializer):
+        a = fields.IntegerField()
+
+    # Then: the compiled fields are immutable references, computed at class
+    # creation; mutating the field map afterwards is not allowed.
+    assert isinstance(ASerializer._compiled_fields, tuple)
+    with pytest.raises(TypeError):
+        ASerializer._field_map["b"] = fields.CharField()